@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 
 # Canonical mapping (normalized_key -> Canonical Name)
 # Key is lowercase with collapsed spaces.
@@ -64,6 +65,9 @@ class AssEventType:
 # Standard event properties -> moved to event.py
 # Format field normalization -> moved to respective models
 
+# Called per field of every parsed/rendered record; the set of distinct
+# keys in a file is tiny, so results are cached
+@lru_cache(maxsize=1024)
 def normalize_key(name: str) -> str:
     """Standardize a string for use as an internal identity key.
     
@@ -1,6 +1,9 @@
 from .registry import (
     TAGS,
     MUTUAL_EXCLUSIVES,
+    FORMATTERS,
+    TAG_NAME_LENGTHS,
+    PARAM_PATTERNS,
     get_tag,
     is_event_level_tag,
     is_first_wins,
@@ -12,6 +15,9 @@ from .base import TagCategory, TagDefinition
 __all__ = [
     "TAGS",
     "MUTUAL_EXCLUSIVES",
+    "FORMATTERS",
+    "TAG_NAME_LENGTHS",
+    "PARAM_PATTERNS",
     "get_tag",
     "is_event_level_tag",
     "is_first_wins",
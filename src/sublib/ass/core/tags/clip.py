@@ -3,7 +3,9 @@ from __future__ import annotations
 from typing import ClassVar
 
 from sublib.ass.core.tags.base import TagCategory
-from sublib.ass.types import AssRectClip, AssVectorClip, AssClipValue
+from sublib.ass.types import (
+    AssRectClip, AssVectorClip, AssClipValue, CLIP_RECT, CLIP_VECTOR,
+)
 
 
 def _parse_clip(raw: str) -> AssClipValue | None:
@@ -38,6 +40,18 @@ def _parse_clip(raw: str) -> AssClipValue | None:
     return AssVectorClip(drawing=raw, scale=1)
 
 
+def _format_clip(name: str, val: AssClipValue) -> str:
+    """Format clip value (shared by ClipTag and IClipTag)."""
+    kind = getattr(val, "kind", None)
+    if kind == CLIP_RECT:
+        return f"\\{name}({val.x1},{val.y1},{val.x2},{val.y2})"
+    elif kind == CLIP_VECTOR:
+        if val.scale != 1:
+            return f"\\{name}({val.scale},{val.drawing})"
+        return f"\\{name}({val.drawing})"
+    return ""
+
+
 class ClipTag:
     """\\clip(...) tag definition."""
     name: ClassVar[str] = "clip"
@@ -54,13 +68,7 @@ class ClipTag:
     
     @staticmethod
     def format(val: AssClipValue) -> str:
-        if isinstance(val, AssRectClip):
-            return f"\\clip({val.x1},{val.y1},{val.x2},{val.y2})"
-        elif isinstance(val, AssVectorClip):
-            if val.scale != 1:
-                return f"\\clip({val.scale},{val.drawing})"
-            return f"\\clip({val.drawing})"
-        return ""
+        return _format_clip("clip", val)
 
 
 class IClipTag:
@@ -79,10 +87,4 @@ class IClipTag:
     
     @staticmethod
     def format(val: AssClipValue) -> str:
-        if isinstance(val, AssRectClip):
-            return f"\\iclip({val.x1},{val.y1},{val.x2},{val.y2})"
-        elif isinstance(val, AssVectorClip):
-            if val.scale != 1:
-                return f"\\iclip({val.scale},{val.drawing})"
-            return f"\\iclip({val.drawing})"
-        return ""
+        return _format_clip("iclip", val)
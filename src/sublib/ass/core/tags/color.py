@@ -8,16 +8,12 @@ from sublib.ass.types import AssColor, AssAlpha
 
 def _parse_color(raw: str) -> AssColor | None:
     """Parse color tag value to AssColor."""
-    try:
-        return AssColor.from_tag_str(raw)
-    except ValueError:
-        return None
+    return AssColor.from_tag_str(raw)
 
 
 def _parse_alpha(raw: str) -> AssAlpha | None:
-    raw = raw.strip().strip("&H").strip("&")
     try:
-        return AssAlpha(value=int(raw, 16))
+        return AssAlpha.from_tag_str(raw)
     except ValueError:
         return None
 
@@ -141,7 +137,7 @@ class AlphaTag:
     
     @staticmethod
     def format(val: AssAlpha) -> str:
-        return f"\\alpha&H{val.value:02X}&"
+        return f"\\alpha{val.to_tag_str()}"
 
 
 class A1Tag:
@@ -160,7 +156,7 @@ class A1Tag:
     
     @staticmethod
     def format(val: AssAlpha) -> str:
-        return f"\\1a&H{val.value:02X}&"
+        return f"\\1a{val.to_tag_str()}"
 
 
 class A2Tag:
@@ -179,7 +175,7 @@ class A2Tag:
     
     @staticmethod
     def format(val: AssAlpha) -> str:
-        return f"\\2a&H{val.value:02X}&"
+        return f"\\2a{val.to_tag_str()}"
 
 
 class A3Tag:
@@ -198,7 +194,7 @@ class A3Tag:
     
     @staticmethod
     def format(val: AssAlpha) -> str:
-        return f"\\3a&H{val.value:02X}&"
+        return f"\\3a{val.to_tag_str()}"
 
 
 class A4Tag:
@@ -217,4 +213,4 @@ class A4Tag:
     
     @staticmethod
     def format(val: AssAlpha) -> str:
-        return f"\\4a&H{val.value:02X}&"
+        return f"\\4a{val.to_tag_str()}"
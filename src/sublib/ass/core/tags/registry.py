@@ -11,7 +11,8 @@ Dependency graph:
             <- registry.py (this file)
 """
 from __future__ import annotations
-from typing import Any, Type
+import re
+from typing import Any, Callable, Type
 
 # Import base types (no circular dependency)
 from sublib.ass.core.tags.base import TagCategory, TagDefinition
@@ -129,6 +130,29 @@ MUTUAL_EXCLUSIVES: dict[str, set[str]] = {
 """Tag name -> set of mutually exclusive tag names."""
 
 
+# Pre-bound format callables, skipping the class lookup per tag
+FORMATTERS: dict[str, Callable[[Any], str]] = {
+    name: cls.format for name, cls in TAGS.items()
+}
+"""Tag name -> format function mapping."""
+
+
+TAG_NAME_LENGTHS: tuple[int, ...] = tuple(sorted({len(name) for name in TAGS}, reverse=True))
+"""Distinct tag name lengths, longest first.
+
+Prefix matching slices each length and looks it up in TAGS, so the
+longest known name wins (\\fscx beats \\fs).
+"""
+
+
+PARAM_PATTERNS: dict[str, re.Pattern] = {
+    name: re.compile(f'^{cls.param_pattern}')
+    for name, cls in TAGS.items()
+    if cls.param_pattern
+}
+"""Tag name -> compiled param_pattern anchored at the value start."""
+
+
 # ============================================================
 # Query Functions
 # ============================================================
@@ -176,7 +200,7 @@ def format_tag(name: str, value: Any) -> str:
     Returns:
         Formatted ASS tag string
     """
-    tag = TAGS.get(name)
-    if tag:
-        return tag.format(value)
+    fmt = FORMATTERS.get(name)
+    if fmt:
+        return fmt(value)
     return f"\\{name}{value}"
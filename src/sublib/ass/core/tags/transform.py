@@ -1,6 +1,5 @@
 """Animation and karaoke tag definitions."""
 from __future__ import annotations
-import re
 from typing import Any, ClassVar, Literal
 
 from sublib.ass.core.tags.base import TagCategory
@@ -36,7 +35,7 @@ def parse_tags_string(tags_str: str) -> list[tuple[str, Any]]:
     Returns:
         List of (tag_name, parsed_value) tuples
     """
-    from sublib.ass.core.tags.registry import TAGS, parse_tag
+    from sublib.ass.core.tags.registry import TAGS, TAG_NAME_LENGTHS, PARAM_PATTERNS, parse_tag
     
     result: list[tuple[str, Any]] = []
     tags_str = tags_str.strip()
@@ -50,9 +49,10 @@ def parse_tags_string(tags_str: str) -> list[tuple[str, Any]]:
             tag_start = i + 1
             
             # Find matching tag name (longest first)
-            for tag_name in sorted(TAGS.keys(), key=len, reverse=True):
-                if tags_str[tag_start:].startswith(tag_name):
-                    tag_cls = TAGS[tag_name]
+            for length in TAG_NAME_LENGTHS:
+                tag_name = tags_str[tag_start:tag_start + length]
+                tag_cls = TAGS.get(tag_name)
+                if tag_cls is not None and len(tag_name) == length:
                     value_start = tag_start + len(tag_name)
                     
                     if tag_cls.is_function:
@@ -79,8 +79,7 @@ def parse_tags_string(tags_str: str) -> list[tuple[str, Any]]:
                         
                         # Validate with param_pattern if available
                         if tag_cls.param_pattern:
-                            pattern = re.compile(f'^{tag_cls.param_pattern}')
-                            match = pattern.match(raw_value)
+                            match = PARAM_PATTERNS[tag_name].match(raw_value)
                             if match:
                                 raw_value = match.group(0)
                                 end_pos = value_start + len(raw_value)
@@ -1,6 +1,7 @@
 """Rendering Engine for ASS models."""
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
 
 from sublib.ass.core.naming import normalize_key, get_canonical_name
 
@@ -12,6 +13,12 @@ if TYPE_CHECKING:
     from sublib.ass.models.event import AssEvent, AssEvents
     from sublib.ass.models.schema import AssStructuredRecord
 
+@lru_cache(maxsize=64)
+def _is_class_attr(cls: type, name: str) -> bool:
+    """True if name resolves on the class itself (e.g. a property like AssEvent.text)."""
+    return hasattr(cls, name)
+
+
 class AssRenderer:
     """Orchestrates the serialization of Domain Models to ASS strings."""
 
@@ -27,6 +34,39 @@ class AssRenderer:
         
         return "\n\n".join(section_texts)
 
+    def iter_file(self, ass_file: AssFile, auto_fill: bool = False) -> Iterator[str]:
+        """Render the entire AssFile as a stream of text chunks.
+        
+        The concatenated chunks equal render_file(); rows are produced one
+        at a time so the full output is never held in memory.
+        """
+        script_type = ass_file.script_info.get('scripttype', 'v4.00+')
+        
+        started = False
+        for section in ass_file.sections:
+            first_line = True
+            for line in self._section_lines(section, script_type=script_type, auto_fill=auto_fill):
+                if first_line:
+                    if started:
+                        yield "\n\n"
+                    started = True
+                    first_line = False
+                    yield line
+                else:
+                    yield "\n" + line
+
+    def _section_lines(self, section: AssSection, script_type: str = "v4.00+", auto_fill: bool = False) -> Iterable[str]:
+        """Lines of a rendered section; styles and events are generated lazily."""
+        from sublib.ass.models.style import AssStyles
+        from sublib.ass.models.event import AssEvents
+        
+        if isinstance(section, AssStyles):
+            return self._style_lines(section, script_type=script_type, auto_fill=auto_fill)
+        if isinstance(section, AssEvents):
+            return self._event_lines(section, script_type=script_type, auto_fill=auto_fill)
+        text = self.render_section(section, script_type=script_type, auto_fill=auto_fill)
+        return (text,) if text else ()
+
     def render_section(self, section: AssSection, script_type: str = "v4.00+", auto_fill: bool = False) -> str:
         """Polymorphic dispatch for section rendering."""
         from sublib.ass.models.info import AssScriptInfo
@@ -76,9 +116,12 @@ class AssRenderer:
 
     def render_styles(self, styles: AssStyles, script_type: str = "v4.00+", auto_fill: bool = False) -> str:
         """Render [V4+ Styles] section."""
-        lines = [f"[{styles.original_name}]"]
+        return "\n".join(self._style_lines(styles, script_type=script_type, auto_fill=auto_fill))
+
+    def _style_lines(self, styles: AssStyles, script_type: str = "v4.00+", auto_fill: bool = False) -> Iterator[str]:
+        yield f"[{styles.original_name}]"
         for comment in styles.comments:
-            lines.append(f"; {comment}")
+            yield f"; {comment}"
             
         if styles.raw_format_fields:
             from sublib.ass.models.style import STYLE_IDENTITY_SCHEMA
@@ -90,15 +133,13 @@ class AssRenderer:
         else:
             out_format = styles.get_explicit_format(script_type)
             
-        lines.append(f"Format: {', '.join(out_format)}")
+        yield f"Format: {', '.join(out_format)}"
         
         for style in styles:
-            lines.append(self.render_style_row(style, out_format, auto_fill=auto_fill))
+            yield self.render_style_row(style, out_format, auto_fill=auto_fill)
             
         for record in styles._custom_records:
-            lines.append(f"{record.raw_descriptor}: {record.value}")
-            
-        return "\n".join(lines)
+            yield f"{record.raw_descriptor}: {record.value}"
 
     def render_style_row(self, style: AssStyle, format_fields: list[str], auto_fill: bool = False) -> str:
         """Render a single style row."""
@@ -108,9 +149,12 @@ class AssRenderer:
 
     def render_events(self, events: AssEvents, script_type: str = "v4.00+", auto_fill: bool = False) -> str:
         """Render [Events] section."""
-        lines = [f"[{events.original_name}]"]
+        return "\n".join(self._event_lines(events, script_type=script_type, auto_fill=auto_fill))
+
+    def _event_lines(self, events: AssEvents, script_type: str = "v4.00+", auto_fill: bool = False) -> Iterator[str]:
+        yield f"[{events.original_name}]"
         for comment in events.comments:
-            lines.append(f"; {comment}")
+            yield f"; {comment}"
             
         if events.raw_format_fields:
             from sublib.ass.models.event import EVENT_IDENTITY_SCHEMA
@@ -123,15 +167,13 @@ class AssRenderer:
             # Fallback for events - usually very standardized
             out_format = ['Layer', 'Start', 'End', 'Style', 'Name', 'MarginL', 'MarginR', 'MarginV', 'Effect', 'Text']
 
-        lines.append(f"Format: {', '.join(out_format)}")
+        yield f"Format: {', '.join(out_format)}"
         
         for event in events:
-            lines.append(self.render_event_row(event, out_format, auto_fill=auto_fill))
+            yield self.render_event_row(event, out_format, auto_fill=auto_fill)
             
         for record in events._custom_records:
-            lines.append(f"{record.raw_descriptor}: {record.value}")
-            
-        return "\n".join(lines)
+            yield f"{record.raw_descriptor}: {record.value}"
 
     def render_event_row(self, event: AssEvent, format_fields: list[str], auto_fill: bool = False) -> str:
         """Render a single event row."""
@@ -144,20 +186,29 @@ class AssRenderer:
 
     def render_record(self, record: AssStructuredRecord, format_fields: list[str], auto_fill: bool = False) -> str:
         """Render fields as a comma-separated string."""
+        record_schema = record._schema
+        record_cls = record.__class__
         parts = []
+        append = parts.append
         for raw_f in format_fields:
             norm_f = normalize_key(raw_f)
             
-            if norm_f in record._schema:
-                schema = record._schema[norm_f]
-                val = getattr(record, schema.python_prop) if schema.python_prop else record._fields.get(schema.normalized_key)
+            schema = record_schema.get(norm_f)
+            if schema is not None:
+                prop = schema.python_prop
+                if prop:
+                    # Item access is what __getattr__ would fall back to; only
+                    # class-level attributes (properties) need real getattr
+                    val = getattr(record, prop) if _is_class_attr(record_cls, prop) else record[prop]
+                else:
+                    val = record._fields.get(schema.normalized_key)
                 
                 if val is None and auto_fill:
                     val = schema.default
-                parts.append(schema.format(val) if val is not None else "")
+                append(schema.format(val) if val is not None else "")
             else:
                 val = record._extra.get(norm_f, "")
-                parts.append(str(val))
+                append(str(val))
         return ",".join(parts)
 
     def render_field(self, record: AssStructuredRecord, norm_key: str, display_name: str | None = None) -> tuple[str, str]:
@@ -11,9 +11,16 @@ if TYPE_CHECKING:
     from sublib.ass.models.style import AssStyle, AssStyles
     from sublib.ass.models.event import AssEvent, AssEvents
 
+# Event fields drawn from a small set of values; pooled so events share one str
+_POOLED_EVENT_KEYS = frozenset({'style', 'name', 'effect'})
+
 class SemanticParser:
     """Orchestrates the conversion of RawRecords to Typed Domain Models."""
 
+    def __init__(self):
+        # value -> shared instance, for _POOLED_EVENT_KEYS
+        self._str_pool: dict[str, str] = {}
+
     def ingest_script_info(self, raw: RawSection) -> AssScriptInfo:
         """Ingest [Script Info] section."""
         from sublib.ass.models.info import AssScriptInfo, INFO_IDENTITY_SCHEMA
@@ -155,21 +162,20 @@ class SemanticParser:
                 ingest_keys = {'layer', 'start', 'end', 'style', 'name', 'marginl', 'marginr', 'marginv', 'effect', 'text'}
 
         standard_descriptors = {normalize_key(t) for t in AssEventType.get_standard_types()}
+        max_split = len(file_format_fields) - 1
+        expected_count = len(file_format_fields)
         for record in raw.records:
             try:
-                parts = [p.strip() for p in record.value.split(',', len(file_format_fields)-1)]
-                record_dict = {name: val for name, val in zip(file_format_fields, parts)}
-                
-                # Apply Slicing Filter
-                filtered_dict = {k: v for k, v in record_dict.items() if k in ingest_keys}
-                
                 if normalize_key(record.descriptor) in standard_descriptors:
+                    # Values are stripped in create_event; split and slice in one pass
+                    parts = record.value.split(',', max_split)
+                    filtered_dict = {name: val for name, val in zip(file_format_fields, parts) if name in ingest_keys}
+                    
                     event = self.create_event(filtered_dict, record.descriptor, record.line_number, auto_fill, events.diagnostics)
                     events.append(event)
                     
                     # Field count check
-                    actual_count = len(record.value.split(','))
-                    expected_count = len(file_format_fields)
+                    actual_count = record.value.count(',') + 1
                     if actual_count < expected_count:
                         events.diagnostics.append(Diagnostic(
                             DiagnosticLevel.WARNING,
@@ -188,10 +194,13 @@ class SemanticParser:
         from sublib.ass.models.event import AssEvent, EVENT_IDENTITY_SCHEMA
         parsed_fields = {}
         extra_fields = {}
+        str_pool = self._str_pool
         
         for k, v in data.items():
             norm_k = normalize_key(k)
             v_str = str(v).strip()
+            if norm_k in _POOLED_EVENT_KEYS:
+                v_str = str_pool.setdefault(v_str, v_str)
             
             if norm_k in EVENT_IDENTITY_SCHEMA:
                 schema = EVENT_IDENTITY_SCHEMA[norm_k]
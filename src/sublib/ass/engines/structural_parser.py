@@ -1,14 +1,17 @@
 """Layer 1 Structural Parser for ASS files."""
 from __future__ import annotations
-from typing import Optional
+from typing import Iterable, Optional
 
 from sublib.ass.core.diagnostics import Diagnostic, DiagnosticLevel
 from sublib.ass.models.raw import RawDocument, RawSection, RawRecord
 from sublib.ass.core.descriptors import (
-    parse_descriptor_line, CORE_SECTIONS, STYLE_SECTIONS, SECTION_RANKS
+    CORE_SECTIONS, STYLE_SECTIONS, SECTION_RANKS
 )
 from sublib.ass.core.naming import normalize_key, get_canonical_name
 
+# Sections whose data lines follow a Format line
+_FORMATTED_SECTIONS = frozenset(STYLE_SECTIONS | {'events'})
+
 
 class StructuralParser:
     """Layer 1 parser: Scans the document structure and basic line types."""
@@ -25,12 +28,22 @@ class StructuralParser:
 
     def parse(self, content: str) -> RawDocument:
         """Parse raw ASS content into a RawDocument structure."""
+        return self.parse_lines(content.splitlines())
+
+    def parse_lines(self, lines: Iterable[str]) -> RawDocument:
+        """Parse ASS lines (without terminators) into a RawDocument structure.
+        
+        Accepts any iterable, so a file can be streamed line by line.
+        """
         doc = RawDocument()
         current_section: Optional[RawSection] = None
         
         non_empty_line_count = 0
+        # Per-section flags, refreshed on each header instead of per line
+        in_core = False
+        in_formatted = False
         
-        for line_number, raw_line in enumerate(content.splitlines(), 1):
+        for line_number, raw_line in enumerate(lines, 1):
             stripped = raw_line.strip()
             
             # 1. Skip strictly empty lines
@@ -38,9 +51,11 @@ class StructuralParser:
                 continue
             
             non_empty_line_count += 1
+            # Classify by the first character; only '[', ';' and '!' need a closer look
+            first = stripped[0]
             
             # 2. Section Headers
-            if stripped.startswith('[') and stripped.endswith(']'):
+            if first == '[' and stripped[-1] == ']':
                 section_name_raw = stripped[1:-1].strip()
                 section_name_norm = normalize_key(section_name_raw)
                 
@@ -72,6 +87,8 @@ class StructuralParser:
                     line_number=line_number
                 )
                 doc.sections.append(current_section)
+                in_core = section_name_norm in CORE_SECTIONS
+                in_formatted = section_name_norm in _FORMATTED_SECTIONS
                 continue
 
             if not current_section:
@@ -84,19 +101,21 @@ class StructuralParser:
 
             # NEW: If this is a raw passthrough section (e.g., [Fonts], [Graphics], or Custom)
             # We treat EVERYTHING as raw lines.
-            if current_section.name.lower() not in CORE_SECTIONS:
+            if not in_core:
                 current_section.raw_lines.append(raw_line)
                 continue
 
             # 3. Comments (All core sections)
-            if stripped.startswith(';') or stripped.startswith('!:'):
-                comment_val = stripped[1:] if stripped.startswith(';') else stripped[2:]
-                current_section.comments.append(comment_val.lstrip())
+            if first == ';':
+                current_section.comments.append(stripped[1:].lstrip())
+                continue
+            if first == '!' and stripped.startswith('!:'):
+                current_section.comments.append(stripped[2:].lstrip())
                 continue
 
-            # 4. Descriptor: Value Lines (Use raw_line to preserve trailing spaces via lstrip in helper)
-            parsed = parse_descriptor_line(raw_line)
-            if not parsed:
+            # 4. Descriptor: Value Lines (inlined parse_descriptor_line; keeps trailing spaces)
+            descriptor, sep, descriptor_content = raw_line.partition(':')
+            if not sep:
                 self.add_diagnostic(
                     DiagnosticLevel.WARNING,
                     f"Malformed line (no descriptor): {stripped[:50]}",
@@ -104,11 +123,12 @@ class StructuralParser:
                 )
                 continue
             
-            descriptor, descriptor_content = parsed
+            descriptor = descriptor.strip()
+            descriptor_content = descriptor_content.lstrip()
             descriptor_norm = normalize_key(descriptor)
             
             # Special case: Format line for Styles/Events
-            if descriptor_norm == 'format' and current_section.name.lower() in (STYLE_SECTIONS | {'events'}):
+            if descriptor_norm == 'format' and in_formatted:
                 self._handle_format_line(current_section, descriptor_content, line_number)
                 continue
 
@@ -121,7 +141,7 @@ class StructuralParser:
             )
             
             # Validation: Missing Format line for Styles/Events
-            if current_section.name in (STYLE_SECTIONS | {'events'}) and not current_section.format_fields:
+            if in_formatted and not current_section.format_fields:
                 self.add_diagnostic(
                     DiagnosticLevel.ERROR,
                     f"Data line before Format line in [{current_section.original_name}]",
@@ -129,7 +149,7 @@ class StructuralParser:
                 )
             
             # Validation: Comma count for Styles/Events
-            if current_section.name in (STYLE_SECTIONS | {'events'}) and current_section.format_fields:
+            if in_formatted and current_section.format_fields:
                 # Note: We don't perform deep comma count validation in Layer 1 for ALL sections, 
                 # but we can check if it looks plausible if we have the format.
                 expected_commas = len(current_section.format_fields) - 1
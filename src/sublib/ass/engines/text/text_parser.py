@@ -10,6 +10,8 @@ from sublib.ass.models.text.elements import (
 )
 from sublib.ass.core.tags import (
     TAGS,
+    TAG_NAME_LENGTHS,
+    PARAM_PATTERNS,
     MUTUAL_EXCLUSIVES,
     get_tag,
     parse_tag,
@@ -30,10 +32,14 @@ class AssTextParser:
     
     Args:
         strict: If True, raise error when comments found. If False, silently preserve.
+        keep_raw: If True, store each tag's original text for lossless roundtrip.
+            If False, tags are re-formatted from their parsed values on render,
+            which saves one string per tag.
     """
     
-    def __init__(self, strict: bool = True):
+    def __init__(self, strict: bool = True, keep_raw: bool = True):
         self.strict = strict
+        self.keep_raw = keep_raw
     
     # Pattern to match override blocks, newlines, and hard spaces
     _BLOCK_PATTERN = re.compile(r'\{([^}]*)\}|\\([Nnh])')
@@ -189,9 +195,10 @@ class AssTextParser:
         # Find tag name - match longest known tag name first
         tag_start = start + 1
         
-        for tag_name in sorted(TAGS.keys(), key=len, reverse=True):
-            if text[tag_start:].startswith(tag_name):
-                tag_cls = TAGS[tag_name]
+        for length in TAG_NAME_LENGTHS:
+            tag_name = text[tag_start:tag_start + length]
+            tag_cls = TAGS.get(tag_name)
+            if tag_cls is not None and len(tag_name) == length:
                 value_start = tag_start + len(tag_name)
                 
                 if tag_cls.is_function:
@@ -207,7 +214,7 @@ class AssTextParser:
                             return (AssOverrideTag(
                                 name=tag_name,
                                 value=parsed_value,
-                                raw=raw,
+                                raw=raw if self.keep_raw else None,
                                 is_event_level=tag_cls.is_event_level,
                                 first_wins=tag_cls.first_wins,
                                 is_function=True,
@@ -216,17 +223,16 @@ class AssTextParser:
                     return None
                 else:
                     # Non-function tag: read value until next backslash or end
-                    end_pos = value_start
-                    while end_pos < len(text) and text[end_pos] != '\\':
-                        end_pos += 1
+                    end_pos = text.find('\\', value_start)
+                    if end_pos < 0:
+                        end_pos = len(text)
                     
                     raw_value = text[value_start:end_pos].strip()
                     raw = text[start:end_pos]
                     
                     # Validate with param_pattern if available
                     if tag_cls.param_pattern:
-                        pattern = re.compile(f'^{tag_cls.param_pattern}')
-                        match = pattern.match(raw_value)
+                        match = PARAM_PATTERNS[tag_name].match(raw_value)
                         if match:
                             raw_value = match.group(0)
                             end_pos = value_start + len(raw_value)
@@ -237,7 +243,7 @@ class AssTextParser:
                         return (AssOverrideTag(
                             name=tag_name,
                             value=parsed_value,
-                            raw=raw,
+                            raw=raw if self.keep_raw else None,
                             is_event_level=tag_cls.is_event_level,
                             first_wins=tag_cls.first_wins,
                             is_function=False,
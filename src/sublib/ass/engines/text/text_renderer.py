@@ -2,11 +2,10 @@
 from __future__ import annotations
 
 from sublib.ass.models.text.elements import (
-    AssOverrideBlock, AssOverrideTag,
-    AssComment, AssSpecialChar, AssPlainText,
-    AssTextElement
+    AssTextElement,
+    KIND_OVERRIDE_BLOCK, KIND_SPECIAL_CHAR, KIND_PLAIN_TEXT,
+    KIND_OVERRIDE_TAG, KIND_COMMENT,
 )
-from sublib.ass.core.tags import get_tag
 
 
 class AssTextRenderer:
@@ -22,26 +21,24 @@ class AssTextRenderer:
         Otherwise, uses the tag's formatter to render from value.
         """
         result = []
+        append = result.append
         
+        # Dispatch on the element kind (plain text first, the most common)
         for elem in elements:
-            if isinstance(elem, AssOverrideBlock):
-                result.append("{")
+            kind = elem.kind
+            if kind == KIND_PLAIN_TEXT:
+                append(elem.content)
+            elif kind == KIND_OVERRIDE_BLOCK:
+                append("{")
                 for item in elem.elements:
-                    if isinstance(item, AssOverrideTag):
-                        # Use raw if available, otherwise render from value
-                        if item.raw:
-                            result.append(item.raw)
-                        else:
-                            tag_cls = get_tag(item.name)
-                            if tag_cls:
-                                result.append(tag_cls.format(item.value))
-                    elif isinstance(item, AssComment):
-                        result.append(item.content)
-                result.append("}")
-            
-            elif isinstance(elem, AssSpecialChar):
-                result.append(elem.render())
-            elif isinstance(elem, AssPlainText):
-                result.append(elem.content)
+                    item_kind = item.kind
+                    if item_kind == KIND_OVERRIDE_TAG:
+                        # Parsed tags keep their raw text; skip the call for them
+                        append(item.raw or item.render())
+                    elif item_kind == KIND_COMMENT:
+                        append(item.content)
+                append("}")
+            elif kind == KIND_SPECIAL_CHAR:
+                append(elem.render())
         
         return "".join(result)
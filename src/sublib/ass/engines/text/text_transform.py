@@ -3,7 +3,7 @@
 These functions extract structured information from parsed AST.
 """
 from __future__ import annotations
-from typing import Any, NamedTuple
+from typing import Any, Callable, NamedTuple, TypeVar
 
 from sublib.ass.models.text.elements import (
     AssOverrideBlock, AssOverrideTag,
@@ -13,6 +13,7 @@ from sublib.ass.models.text.elements import (
 from sublib.ass.models.text.segment import AssTextSegment
 from sublib.ass.core.tags import MUTUAL_EXCLUSIVES
 
+_SegmentT = TypeVar('_SegmentT')
 
 
 def extract_event_tags_and_segments(elements: list[AssTextElement]) -> tuple[dict[str, Any], list[AssTextSegment]]:
@@ -24,10 +25,39 @@ def extract_event_tags_and_segments(elements: list[AssTextElement]) -> tuple[dic
     - Segments are emitted only when content (text/special chars) is encountered.
     - Tags are NOT accumulated across segments (Differential).
     """
+    return _extract(elements, AssTextSegment)
+
+
+def extract_event_tags_and_segment_tuples(
+    elements: list[AssTextElement]
+) -> tuple[dict[str, Any], list[tuple[dict[str, Any], list[AssPlainText | AssSpecialChar]]]]:
+    """Like extract_event_tags_and_segments(), but segments are plain tuples.
+    
+    Each segment is a (block_tags, content) pair, for callers that unpack
+    segments directly and do not need the AssTextSegment API:
+    
+        event_tags, segments = extract_event_tags_and_segment_tuples(elements)
+        for block_tags, content in segments:
+            ...
+    """
+    return _extract(elements, _segment_tuple)
+
+
+def _segment_tuple(
+    block_tags: dict[str, Any], content: list[AssPlainText | AssSpecialChar]
+) -> tuple[dict[str, Any], list[AssPlainText | AssSpecialChar]]:
+    return (block_tags, content)
+
+
+def _extract(
+    elements: list[AssTextElement],
+    make_segment: Callable[[dict[str, Any], list[AssPlainText | AssSpecialChar]], _SegmentT],
+) -> tuple[dict[str, Any], list[_SegmentT]]:
+    """Shared extraction loop; make_segment(block_tags, content) builds each segment."""
     event_tags: dict[str, Any] = {}
     seen_first_win: set[str] = set()
     
-    segments: list[AssTextSegment] = []
+    segments: list[_SegmentT] = []
     pending_tags: dict[str, Any] = {}
     current_content: list[AssPlainText | AssSpecialChar] = []
 
@@ -69,10 +99,7 @@ def extract_event_tags_and_segments(elements: list[AssTextElement]) -> tuple[dic
         if isinstance(elem, AssOverrideBlock):
             # If we were collecting content, it means a new block group has started
             if current_content:
-                segments.append(AssTextSegment(
-                    block_tags=pending_tags.copy(),
-                    content=current_content.copy()
-                ))
+                segments.append(make_segment(pending_tags.copy(), current_content.copy()))
                 current_content = []
                 pending_tags = {} # Clear for differential behavior
             
@@ -88,10 +115,7 @@ def extract_event_tags_and_segments(elements: list[AssTextElement]) -> tuple[dic
 
     # Final segment emission
     if current_content:
-        segments.append(AssTextSegment(
-            block_tags=pending_tags,
-            content=current_content
-        ))
+        segments.append(make_segment(pending_tags, current_content))
     
     return event_tags, segments
 
@@ -119,7 +143,7 @@ def build_text_elements(
         )
         text = AssTextRenderer().render(elements)
     """
-    from sublib.ass.core.tags import get_tag, format_tag
+    from sublib.ass.core.tags import get_tag
     
     elements: list[AssTextElement] = []
     
@@ -132,7 +156,6 @@ def build_text_elements(
                 event_block_tags.append(AssOverrideTag(
                     name=name,
                     value=value,
-                    raw=format_tag(name, value),
                     is_event_level=tag_cls.is_event_level,
                     first_wins=tag_cls.first_wins,
                     is_function=tag_cls.is_function,
@@ -156,7 +179,6 @@ def build_text_elements(
                         block_tags.append(AssOverrideTag(
                             name=name,
                             value=value,
-                            raw=format_tag(name, value),
                             is_event_level=tag_cls.is_event_level,
                             first_wins=tag_cls.first_wins,
                             is_function=tag_cls.is_function,
@@ -5,12 +5,17 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from sublib.ass.models.file import AssFile
+    from sublib.ass.models.raw import RawDocument
+    from sublib.ass.engines.structural_parser import StructuralParser
 
 def load_file(path: Path | str, style_format: list[str] | None = [], event_format: list[str] | None = [], auto_fill: bool = True) -> "AssFile":
-    """Load an ASS file from path."""
-    from sublib.io import read_text_file
-    content = read_text_file(path, encoding='utf-8-sig')
-    return load_string(content, style_format=style_format, event_format=event_format, auto_fill=auto_fill)
+    """Load an ASS file from path, streaming it line by line."""
+    from sublib.io import iter_text_lines
+    from sublib.ass.engines.structural_parser import StructuralParser
+    
+    struct_parser = StructuralParser()
+    raw_doc = struct_parser.parse_lines(iter_text_lines(path, encoding='utf-8-sig'))
+    return _build_file(struct_parser, raw_doc, style_format=style_format, event_format=event_format, auto_fill=auto_fill)
 
 def load_string(content: str, style_format: list[str] | None = [], event_format: list[str] | None = [], auto_fill: bool = True) -> "AssFile":
     """Parse ASS content from string using the decoupled Engine architecture.
@@ -19,16 +24,20 @@ def load_string(content: str, style_format: list[str] | None = [], event_format:
     Stage 2: Semantic Stage (Ingestion)
     Stage 3: Orchestration Stage (Model Building)
     """
-    from sublib.ass.core.diagnostics import Diagnostic, DiagnosticLevel, AssStructuralError
     from sublib.ass.engines.structural_parser import StructuralParser
-    from sublib.ass.engines.semantic_parser import SemanticParser
-    from sublib.ass.models.file import AssFile
-    from sublib.ass.models.info import AssScriptInfo
-    from sublib.ass.models.base import AssSection, AssRawSection
     
     # --- Stage 1: Structural Stage ---
     struct_parser = StructuralParser()
     raw_doc = struct_parser.parse(content)
+    return _build_file(struct_parser, raw_doc, style_format=style_format, event_format=event_format, auto_fill=auto_fill)
+
+def _build_file(struct_parser: "StructuralParser", raw_doc: "RawDocument", style_format: list[str] | None = [], event_format: list[str] | None = [], auto_fill: bool = True) -> "AssFile":
+    """Run the semantic and orchestration stages on a structurally parsed document."""
+    from sublib.ass.core.diagnostics import Diagnostic, DiagnosticLevel, AssStructuralError
+    from sublib.ass.engines.semantic_parser import SemanticParser
+    from sublib.ass.models.file import AssFile
+    from sublib.ass.models.info import AssScriptInfo
+    from sublib.ass.models.base import AssSection, AssRawSection
     
     # Halt if structural errors are fatal
     errors = [d for d in struct_parser.diagnostics if d.level == DiagnosticLevel.ERROR]
@@ -12,7 +12,8 @@ def render_string(ass_file: AssFile, auto_fill: bool = False) -> str:
     return AssRenderer().render_file(ass_file, auto_fill=auto_fill)
 
 def write_file(ass_file: AssFile, path: Path | str, auto_fill: bool = False) -> None:
-    """Save ASS file model to path."""
-    from sublib.io import write_text_file
-    content = render_string(ass_file, auto_fill=auto_fill)
-    write_text_file(path, content, encoding='utf-8-sig')
+    """Save ASS file model to path, streaming rows to the file."""
+    from sublib.io import write_text_chunks
+    from sublib.ass.engines.doc_renderer import AssRenderer
+    chunks = AssRenderer().iter_file(ass_file, auto_fill=auto_fill)
+    write_text_chunks(path, chunks, encoding='utf-8-sig')
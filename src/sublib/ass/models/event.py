@@ -1,5 +1,6 @@
 """ASS Event models using Eager Sparse Typed Storage."""
 from __future__ import annotations
+from array import array
 from typing import Any, Iterable, Optional, TYPE_CHECKING, Literal
 from sublib.ass.core.naming import normalize_key, get_canonical_name, AssEventType
 from sublib.ass.models.text.elements import AssTextElement
@@ -112,7 +113,8 @@ class AssEvent(AssStructuredRecord):
 
     @property
     def duration(self) -> AssTimestamp:
-        return self.end - self.start
+        # Item access skips the failed attribute lookup behind __getattr__
+        return self['end'] - self['start']
 
     def extract_event_tags_and_segments(self) -> tuple[dict[str, Any], list[AssTextSegment]]:
         """Extract event-level tags and inline segments using a Differential Model."""
@@ -170,6 +172,71 @@ class AssEvents(AssFormatSection):
         target = style.lower()
         return [e for e in self._data if e.style.lower() == target]
 
+    def shift(self, delta_ms: int) -> None:
+        """Shift start and end of every event by delta_ms milliseconds.
+        
+        The delta is rounded to whole centiseconds half away from zero, so
+        shift(-n) undoes shift(n) as long as no time was clamped: times
+        that would become negative are set to 0.
+        """
+        delta = (abs(delta_ms) + 5) // 10
+        if delta_ms < 0:
+            delta = -delta
+        start_key = EVENT_SCHEMA['start'].normalized_key
+        end_key = EVENT_SCHEMA['end'].normalized_key
+        for event in self._data:
+            # Fresh timestamps: unset fields share the schema default instance
+            fields = event._fields
+            fields[start_key] = AssTimestamp(max(event[start_key].cs + delta, 0))
+            fields[end_key] = AssTimestamp(max(event[end_key].cs + delta, 0))
+
+    def get_times(self) -> tuple[array, array]:
+        """Start and end times of all events as parallel centisecond arrays.
+        
+        The arrays support the buffer protocol, so they can be wrapped
+        without copying (e.g. numpy.frombuffer) for vectorized retiming,
+        then written back with set_times().
+        """
+        start_key = EVENT_SCHEMA['start'].normalized_key
+        end_key = EVENT_SCHEMA['end'].normalized_key
+        data = self._data
+        starts = array('q', [e[start_key].cs for e in data])
+        ends = array('q', [e[end_key].cs for e in data])
+        return starts, ends
+
+    def get_int_column(self, name: str) -> array:
+        """Values of an integer field (e.g. 'layer', 'margin_l') for all events.
+
+        Like get_times(), the result is a compact array usable as a buffer,
+        so bulk filtering (e.g. by layer) need not touch AssEvent objects.
+        """
+        schema = EVENT_SCHEMA.get(name)
+        if schema is None or schema.converter is not int:
+            raise ValueError(f"Not an integer event field: {name!r}")
+        # Look up by property name so values match attribute access
+        # (e.g. event.margin_v), which resolves through the record's prop map
+        return array('q', [e[name] for e in self._data])
+
+    def set_times(self, starts: Iterable[int], ends: Iterable[int]) -> None:
+        """Assign start and end times (centiseconds) to all events in order."""
+        starts = list(starts)
+        ends = list(ends)
+        if len(starts) != len(self._data) or len(ends) != len(self._data):
+            raise ValueError(f"Expected {len(self._data)} start and end times, got {len(starts)} and {len(ends)}")
+        start_key = EVENT_SCHEMA['start'].normalized_key
+        end_key = EVENT_SCHEMA['end'].normalized_key
+        for event, start, end in zip(self._data, starts, ends):
+            fields = event._fields
+            fields[start_key] = AssTimestamp(int(start))
+            fields[end_key] = AssTimestamp(int(end))
+
+    def sort_by_time(self) -> None:
+        """Sort events in place by start time (stable)."""
+        start_key = EVENT_SCHEMA['start'].normalized_key
+        starts = [e[start_key].cs for e in self._data]
+        order = sorted(range(len(starts)), key=starts.__getitem__)
+        self._data[:] = [self._data[i] for i in order]
+
     def get_explicit_format(self, script_type: str | None = None) -> list[str]:
         """Union of all physical keys."""
         is_v4 = script_type and 'v4' in script_type.lower() and '+' not in script_type
@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class RawRecord:
     """A raw key-value pair from a descriptor line."""
     descriptor: str  # Standardized name if known
@@ -12,7 +12,7 @@ class RawRecord:
     line_number: int
 
 
-@dataclass
+@dataclass(slots=True)
 class RawSection:
     """A raw section containing comments and records."""
     name: str  # Standardized name (e.g., 'Script Info')
@@ -29,7 +29,7 @@ class RawSection:
     format_line_number: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RawDocument:
     """A collection of raw sections."""
     sections: list[RawSection] = field(default_factory=list)
@@ -6,6 +6,27 @@ from sublib.ass.core.naming import normalize_key
 if TYPE_CHECKING:
     from sublib.ass.core.diagnostics import Diagnostic
 
+
+_PLAIN_TYPES = frozenset({str, int, float, bool})
+
+
+def _parse_bool(raw: str) -> bool:
+    return raw not in ('0', 'false', 'False', 'no', 'No', '')
+
+
+def _resolve_parser(converter: Callable) -> Callable[[str], Any]:
+    """Pick the raw-string parser for a converter once, at schema build time."""
+    if converter == bool:
+        return _parse_bool
+    if converter in (int, float, str):
+        return converter
+    # Fallback to custom converter or type constructor
+    if hasattr(converter, 'from_style_str'):
+        return converter.from_style_str
+    if hasattr(converter, 'from_ass_str'):
+        return converter.from_ass_str
+    return converter
+
 class FieldSchema:
     """Definition for a single field in an ASS record."""
     def __init__(
@@ -22,6 +43,7 @@ class FieldSchema:
         self.canonical_name = canonical_name
         self.python_prop = python_prop
         self.normalized_key = normalize_key(canonical_name)
+        self._parse = _resolve_parser(converter)
 
     def convert(self, value: Any, diagnostics: Optional[list[Diagnostic]] = None, line_number: int = 0) -> Any:
         """Convert raw value to typed value with diagnostic reporting."""
@@ -33,23 +55,7 @@ class FieldSchema:
             return self.default
             
         try:
-            # Special handling for common types
-            if self.converter == bool:
-                return raw_str not in ('0', 'false', 'False', 'no', 'No', '')
-            if self.converter == int:
-                return int(raw_str)
-            if self.converter == float:
-                return float(raw_str)
-            if self.converter == str:
-                return raw_str
-                
-            # Fallback to custom converter or type constructor
-            if hasattr(self.converter, 'from_style_str'):
-                return self.converter.from_style_str(raw_str)
-            if hasattr(self.converter, 'from_ass_str'):
-                return self.converter.from_ass_str(raw_str)
-                
-            return self.converter(raw_str)
+            return self._parse(raw_str)
         except (ValueError, TypeError):
             if diagnostics is not None:
                 from sublib.ass.core.diagnostics import Diagnostic, DiagnosticLevel
@@ -64,6 +70,9 @@ class FieldSchema:
         """Format typed value to ASS string."""
         if value is None:
             return ""
+        if value.__class__ in _PLAIN_TYPES:
+            # Builtins have neither to_style_str nor to_ass_str
+            return self.formatter(value)
         if hasattr(value, 'to_style_str'):
             return value.to_style_str()
         if hasattr(value, 'to_ass_str'):
@@ -80,8 +89,9 @@ class AssStructuredRecord:
         # normalized_key -> raw_str (Custom/Unknown fields)
         self._extra = extra or {}
         
-        # reverse map: python_prop -> normalized_key
-        self._prop_map = {s.python_prop: k for k, s in schema.items() if s.python_prop}
+        # reverse map: python_prop -> normalized_key; alias keys share their
+        # canonical entry, so always map to that entry's own key
+        self._prop_map = {s.python_prop: s.normalized_key for s in schema.values() if s.python_prop}
 
     def _resolve_key(self, key: str) -> str:
         """Resolve property name or raw key to normalized identity key."""
@@ -6,12 +6,22 @@ aligned with official ASS specification terminology.
 from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Union
+from typing import Any, ClassVar, Union
+
+from sublib.ass.core.tags import format_tag
+
+
+# Element kind discriminants, for dispatch without isinstance chains
+KIND_OVERRIDE_BLOCK = 0
+KIND_SPECIAL_CHAR = 1
+KIND_PLAIN_TEXT = 2
+KIND_OVERRIDE_TAG = 3
+KIND_COMMENT = 4
 
 
 # ===== Override System (inside {...}) =====
 
-@dataclass
+@dataclass(slots=True)
 class AssOverrideTag:
     """Override tag within override blocks.
     
@@ -23,26 +33,32 @@ class AssOverrideTag:
     Attributes:
         name: Tag name without backslash (e.g., "b", "pos", "1c")
         value: Parsed value (type depends on tag)
-        raw: Original string for roundtrip
+        raw: Original string for roundtrip, or None to format from value
         is_event_level: Whether this affects the entire line
         first_wins: Whether first occurrence wins (vs last)
         is_function: Whether tag uses function syntax with parentheses
     """
+    kind: ClassVar[int] = KIND_OVERRIDE_TAG
     name: str
     value: Any
-    raw: str
+    raw: str | None = None
     is_event_level: bool = False
     first_wins: bool = False
     is_function: bool = False
+    
+    def render(self) -> str:
+        """Render to ASS text, preferring the original raw string."""
+        return self.raw or format_tag(self.name, self.value)
 
 
-@dataclass
+@dataclass(slots=True)
 class AssComment:
     """Comment/unrecognized text inside an override block."""
+    kind: ClassVar[int] = KIND_COMMENT
     content: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AssOverrideBlock:
     """Override block: {...}
     
@@ -51,6 +67,7 @@ class AssOverrideBlock:
     
     Contains override tags and optionally comments (unrecognized text).
     """
+    kind: ClassVar[int] = KIND_OVERRIDE_BLOCK
     elements: list[Union[AssOverrideTag, AssComment]]
 
 
@@ -67,7 +84,11 @@ class SpecialCharType(Enum):
     HARD_SPACE = 'h'     # \\h - Non-breaking space
 
 
-@dataclass
+# Rendered escape for each special char type (avoids Enum.value + f-string per render)
+_SPECIAL_CHAR_STRS = {t: f'\\{t.value}' for t in SpecialCharType}
+
+
+@dataclass(slots=True)
 class AssSpecialChar:
     """Special character (\\N, \\n, \\h).
     
@@ -79,6 +100,7 @@ class AssSpecialChar:
     Attributes:
         type: Which special character this represents
     """
+    kind: ClassVar[int] = KIND_SPECIAL_CHAR
     type: SpecialCharType
     
     @property
@@ -96,15 +118,16 @@ class AssSpecialChar:
     
     def render(self) -> str:
         """Render to ASS text."""
-        return f'\\{self.type.value}'
+        return _SPECIAL_CHAR_STRS[self.type]
 
 
-@dataclass
+@dataclass(slots=True)
 class AssPlainText:
     """Plain text content.
     
     Regular text without special meaning.
     """
+    kind: ClassVar[int] = KIND_PLAIN_TEXT
     content: str
 
 
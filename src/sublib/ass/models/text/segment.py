@@ -3,11 +3,13 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, TYPE_CHECKING
 
+from sublib.ass.models.text.elements import KIND_PLAIN_TEXT, KIND_SPECIAL_CHAR
+
 if TYPE_CHECKING:
     from sublib.ass.models.text.elements import AssPlainText, AssSpecialChar
 
 
-@dataclass
+@dataclass(slots=True)
 class AssTextSegment:
     """A text segment with its formatting tags.
     
@@ -30,14 +32,14 @@ class AssTextSegment:
         Convenience method for simple use cases.
         Special chars rendered as escape sequences (\\N, \\n, \\h).
         """
-        from sublib.ass.models.text.elements import AssPlainText, AssSpecialChar
-        
         result = []
+        append = result.append
         for item in self.content:
-            if isinstance(item, AssPlainText):
-                result.append(item.content)
-            elif isinstance(item, AssSpecialChar):
-                result.append(item.render())
+            kind = item.kind
+            if kind == KIND_PLAIN_TEXT:
+                append(item.content)
+            elif kind == KIND_SPECIAL_CHAR:
+                append(item.render())
         return "".join(result)
     
     def __len__(self) -> int:
@@ -1,7 +1,7 @@
 """ASS value types shared between styles and tags."""
 from .color import AssColor, AssAlpha
 from .position import AssPosition, AssMove
-from .clip import AssRectClip, AssVectorClip, AssClipValue
+from .clip import AssRectClip, AssVectorClip, AssClipValue, CLIP_RECT, CLIP_VECTOR
 from .fade import AssFade, AssFadeComplex
 from .layout import AssAlignment, AssWrapStyle
 from .animation import AssTransform, AssKaraoke
@@ -10,7 +10,7 @@ from .timestamp import AssTimestamp
 __all__ = [
     "AssColor", "AssAlpha",
     "AssPosition", "AssMove",
-    "AssRectClip", "AssVectorClip", "AssClipValue",
+    "AssRectClip", "AssVectorClip", "AssClipValue", "CLIP_RECT", "CLIP_VECTOR",
     "AssFade", "AssFadeComplex",
     "AssAlignment", "AssWrapStyle",
     "AssTransform", "AssKaraoke",
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Any, Literal
 
 
-@dataclass
+@dataclass(slots=True)
 class AssTransform:
     """Value for \\t(...) animated transform tag.
     
@@ -22,11 +22,16 @@ class AssTransform:
     
     def to_raw_tags(self) -> str:
         """Render parsed tags back to raw string for ASS output."""
-        from sublib.ass.core.tags.registry import format_tag
-        return "".join(format_tag(name, val) for name, val in self.tags)
+        from sublib.ass.core.tags.registry import FORMATTERS
+        fmts = FORMATTERS
+        parts = []
+        for name, val in self.tags:
+            fmt = fmts.get(name)
+            parts.append(fmt(val) if fmt else f"\\{name}{val}")
+        return "".join(parts)
 
 
-@dataclass
+@dataclass(slots=True)
 class AssKaraoke:
     """Value for karaoke tags (\\k, \\K, \\kf, \\ko, \\kt)."""
     duration: int
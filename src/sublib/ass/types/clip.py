@@ -1,20 +1,28 @@
 """Clip value types for ASS format."""
 from __future__ import annotations
 from dataclasses import dataclass
+from typing import ClassVar
 
 
-@dataclass
+# Clip kind discriminants
+CLIP_RECT = 0
+CLIP_VECTOR = 1
+
+
+@dataclass(slots=True)
 class AssRectClip:
     """Rectangle clip value."""
+    kind: ClassVar[int] = CLIP_RECT
     x1: int
     y1: int
     x2: int
     y2: int
 
 
-@dataclass
+@dataclass(slots=True)
 class AssVectorClip:
     """Vector drawing clip value."""
+    kind: ClassVar[int] = CLIP_VECTOR
     drawing: str
     scale: int = 1
 
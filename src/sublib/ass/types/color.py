@@ -4,9 +4,35 @@ These types are shared between Style definitions and override tags.
 """
 from __future__ import annotations
 from dataclasses import dataclass
+from functools import lru_cache
 
 
-@dataclass
+# Two-digit uppercase hex for every channel value, indexed by value
+_HEX2 = tuple(f"{i:02X}" for i in range(256))
+
+# Pre-rendered alpha tag values (&H00& .. &HFF&)
+_ALPHA_STRS = tuple(f"&H{i:02X}&" for i in range(256))
+
+# Reverse table for alpha tags: canonical &HXX& strings skip int(s, 16)
+_ALPHA_VALUES = {f"&H{i:02x}&": i for i in range(256)}
+_ALPHA_VALUES.update({s: i for i, s in enumerate(_ALPHA_STRS)})
+
+
+def _parse_hex(s: str) -> int | None:
+    """Parse &H-prefixed hex (&HAABBGGRR, &HBBGGRR&, &HAA&) to int, or None."""
+    try:
+        return int(s.strip().lstrip("&H").rstrip("&"), 16)
+    except ValueError:
+        return None
+
+
+def _fits_bytes(r: object, g: object, b: object, a: object) -> bool:
+    """True if every channel is an int in 0-255."""
+    return (r.__class__ is int and g.__class__ is int and b.__class__ is int and a.__class__ is int
+            and 0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255 and 0 <= a <= 255)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class AssColor:
     """ASS color value.
     
@@ -16,6 +42,9 @@ class AssColor:
     Style format: &HAABBGGRR (8 hex digits, includes alpha)
     Tag format: &HBBGGRR& (6 hex digits, no alpha)
     
+    Instances are immutable; parsed colors are interned, so identical
+    color strings share one object.
+    
     Attributes:
         r: Red channel (0-255)
         g: Green channel (0-255)
@@ -27,6 +56,23 @@ class AssColor:
     b: int
     a: int = 0
     
+    def _key(self) -> int | tuple[int, int, int, int]:
+        """All four channels packed as &HAABBGGRR, used for __eq__ and __hash__."""
+        r, g, b, a = self.r, self.g, self.b, self.a
+        if _fits_bytes(r, g, b, a):
+            return (a << 24) | (b << 16) | (g << 8) | r
+        # Channels that do not fit a byte would collide when packed;
+        # compare them field by field instead
+        return (r, g, b, a)
+    
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is self.__class__:
+            return self._key() == other._key()
+        return NotImplemented
+    
+    def __hash__(self) -> int:
+        return hash(self._key())
+    
     @classmethod
     def from_style_str(cls, s: str) -> "AssColor":
         """Parse from style string (&HAABBGGRR).
@@ -37,16 +83,11 @@ class AssColor:
         Returns:
             AssColor with parsed r, g, b, a
         """
-        s = s.strip().lstrip("&H").rstrip("&")
-        try:
-            value = int(s, 16)
-            a = (value >> 24) & 0xFF
-            b = (value >> 16) & 0xFF
-            g = (value >> 8) & 0xFF
-            r = value & 0xFF
-            return cls(r=r, g=g, b=b, a=a)
-        except ValueError:
-            return cls(r=0, g=0, b=0, a=0)
+        if cls is AssColor:
+            return _style_color(s)
+        value = (_parse_hex(s) or 0) & 0xFFFFFFFF
+        a, b, g, r = value.to_bytes(4, "big")
+        return cls(r, g, b, a)
     
     @classmethod
     def from_tag_str(cls, s: str) -> "AssColor":
@@ -58,29 +99,49 @@ class AssColor:
         Returns:
             AssColor with parsed r, g, b (alpha defaults to 0)
         """
-        s = s.strip().lstrip("&H").rstrip("&")
-        try:
-            value = int(s, 16)
-            b = (value >> 16) & 0xFF
-            g = (value >> 8) & 0xFF
-            r = value & 0xFF
-            return cls(r=r, g=g, b=b, a=0)
-        except ValueError:
-            return cls(r=0, g=0, b=0, a=0)
+        if cls is AssColor:
+            return _tag_color(s)
+        value = (_parse_hex(s) or 0) & 0xFFFFFF
+        _, b, g, r = value.to_bytes(4, "big")
+        return cls(r, g, b, 0)
     
     def to_style_str(self) -> str:
         """Format for style output (e.g., &H00FFFFFF).
         
         Style format has no trailing &, per libass Wiki.
         """
+        if _fits_bytes(self.r, self.g, self.b, self.a):
+            return f"&H{_HEX2[self.a]}{_HEX2[self.b]}{_HEX2[self.g]}{_HEX2[self.r]}"
         return f"&H{self.a:02X}{self.b:02X}{self.g:02X}{self.r:02X}"
     
     def to_tag_str(self) -> str:
         """Format for tag output (e.g., &HFFFFFF&)."""
+        if _fits_bytes(self.r, self.g, self.b, 0):
+            return f"&H{_HEX2[self.b]}{_HEX2[self.g]}{_HEX2[self.r]}&"
         return f"&H{self.b:02X}{self.g:02X}{self.r:02X}&"
 
 
-@dataclass
+@lru_cache(maxsize=4096)
+def _intern_color(value: int) -> AssColor:
+    """Get the shared AssColor for a packed &HAABBGGRR value."""
+    # Big-endian bytes of &HAABBGGRR are already in a, b, g, r order
+    a, b, g, r = value.to_bytes(4, "big")
+    return AssColor(r, g, b, a)
+
+
+# Palettes repeat across styles and tags; cache by raw string so repeats
+# skip hex parsing entirely
+@lru_cache(maxsize=512)
+def _style_color(s: str) -> AssColor:
+    return _intern_color((_parse_hex(s) or 0) & 0xFFFFFFFF)
+
+
+@lru_cache(maxsize=512)
+def _tag_color(s: str) -> AssColor:
+    return _intern_color((_parse_hex(s) or 0) & 0xFFFFFF)
+
+
+@dataclass(slots=True)
 class AssAlpha:
     """ASS alpha value.
     
@@ -88,6 +149,25 @@ class AssAlpha:
     """
     value: int
     
+    @classmethod
+    def from_tag_str(cls, s: str) -> "AssAlpha":
+        """Parse from tag string (&HAA&).
+        
+        Args:
+            s: Tag alpha string, e.g. "&H80&" or "&H80H&"
+            
+        Returns:
+            AssAlpha with parsed value
+            
+        Raises:
+            ValueError: If s holds no hex value
+        """
+        value = _ALPHA_VALUES.get(s)
+        if value is None:
+            # Also strips a trailing H (&H80H&), which renderers accept
+            value = int(s.strip().strip("&H").strip("&"), 16)
+        return cls(value)
+    
     @property
     def opacity(self) -> float:
         """Get opacity as 0.0-1.0 value."""
@@ -95,4 +175,8 @@ class AssAlpha:
     
     def to_tag_str(self) -> str:
         """Format for tag output (e.g., &HFF&)."""
-        return f"&H{self.value:02X}&"
+        value = self.value
+        # Negative values would index the table from the end
+        if value.__class__ is int and 0 <= value <= 255:
+            return _ALPHA_STRS[value]
+        return f"&H{value:02X}&"
@@ -3,14 +3,14 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class AssFade:
     """Value for \\fad(fadein,fadeout) tag."""
     fadein: int
     fadeout: int
 
 
-@dataclass
+@dataclass(slots=True)
 class AssFadeComplex:
     """Value for \\fade(a1,a2,a3,t1,t2,t3,t4) tag."""
     a1: int
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Literal
 
 
-@dataclass
+@dataclass(slots=True)
 class AssAlignment:
     """Alignment value (numpad style 1-9).
     
@@ -16,7 +16,7 @@ class AssAlignment:
     legacy: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class AssWrapStyle:
     """Wrap style value (0-3)."""
     style: Literal[0, 1, 2, 3]
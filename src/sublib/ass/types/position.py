@@ -3,14 +3,14 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class AssPosition:
     """Value for \\pos(x,y) and \\org(x,y) tags."""
     x: float
     y: float
 
 
-@dataclass
+@dataclass(slots=True)
 class AssMove:
     """Value for \\move(x1,y1,x2,y2[,t1,t2]) tag."""
     x1: float
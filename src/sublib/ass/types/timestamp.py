@@ -4,9 +4,23 @@ ASS uses H:MM:SS.CC format where CC is centiseconds (hundredths of a second).
 """
 from __future__ import annotations
 from dataclasses import dataclass
+from functools import lru_cache
 
+# Zero-padded two-digit strings for minutes, seconds and centiseconds
+_TWO_DIGITS = tuple(f"{i:02d}" for i in range(100))
 
-@dataclass
+
+# Event boundaries recur (one line's end is often the next line's start),
+# so formatted strings are cached by centisecond value
+@lru_cache(maxsize=8192)
+def _format_cs(cs: int) -> str:
+    hours, rem = divmod(cs, 360000)
+    minutes, rem = divmod(rem, 6000)
+    seconds, centiseconds = divmod(rem, 100)
+    return f"{hours}:{_TWO_DIGITS[minutes]}:{_TWO_DIGITS[seconds]}.{_TWO_DIGITS[centiseconds]}"
+
+
+@dataclass(slots=True)
 class AssTimestamp:
     """ASS timestamp value.
     
@@ -58,34 +72,31 @@ class AssTimestamp:
         Returns:
             AssTimestamp with parsed value
         """
-        s = s.strip()
-        parts = s.split(':')
-        if len(parts) != 3:
-            return cls(cs=0)
-        
-        try:
-            hours = int(parts[0])
-            minutes = int(parts[1])
-            sec_parts = parts[2].split('.')
-            seconds = int(sec_parts[0])
-            centiseconds = int(sec_parts[1]) if len(sec_parts) > 1 else 0
-            
-            total_cs = hours * 360000 + minutes * 6000 + seconds * 100 + centiseconds
-            return cls(cs=total_cs)
-        except ValueError:
-            return cls(cs=0)
+        parts = s.strip().split(':')
+        if len(parts) == 3:
+            seconds, dot, centiseconds = parts[2].partition('.')
+            try:
+                return cls(
+                    int(parts[0]) * 360000
+                    + int(parts[1]) * 6000
+                    + int(seconds) * 100
+                    + (int(centiseconds.partition('.')[0]) if dot else 0)
+                )
+            except ValueError:
+                pass
+        return cls(0)
     
     def to_ass_str(self) -> str:
         """Format as ASS timestamp string (H:MM:SS.CC)."""
-        return f"{self.hours}:{self.minutes:02d}:{self.seconds:02d}.{self.centiseconds:02d}"
+        return _format_cs(self.cs)
     
     def __sub__(self, other: "AssTimestamp") -> "AssTimestamp":
         """Subtract two timestamps."""
-        return AssTimestamp(cs=self.cs - other.cs)
+        return AssTimestamp(self.cs - other.cs)
     
     def __add__(self, other: "AssTimestamp") -> "AssTimestamp":
         """Add two timestamps."""
-        return AssTimestamp(cs=self.cs + other.cs)
+        return AssTimestamp(self.cs + other.cs)
     
     def __lt__(self, other: "AssTimestamp") -> bool:
         return self.cs < other.cs
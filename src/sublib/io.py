@@ -4,7 +4,11 @@ Provides encoding-aware file read/write operations.
 Format-specific logic (parsing, rendering) is handled by the respective model classes.
 """
 from __future__ import annotations
+import os
+import secrets
+import stat
 from pathlib import Path
+from typing import Iterable, Iterator
 
 
 def read_text_file(path: Path | str, encoding: str = 'utf-8') -> str:
@@ -22,6 +26,28 @@ def read_text_file(path: Path | str, encoding: str = 'utf-8') -> str:
         return f.read()
 
 
+def iter_text_lines(path: Path | str, encoding: str = 'utf-8') -> Iterator[str]:
+    """Read text file line by line with specified encoding.
+    
+    The file is decoded incrementally, so the whole content is never held
+    in memory as one string.
+    
+    Args:
+        path: Path to file
+        encoding: File encoding (e.g., 'utf-8', 'utf-8-sig')
+        
+    Yields:
+        Lines without line terminators, split exactly as
+        str.splitlines() splits the whole content
+    """
+    path = Path(path)
+    with open(path, 'r', encoding=encoding) as f:
+        for line in f:
+            # The file iterator only splits on newlines; splitlines() also
+            # breaks on \x0b, \x0c, \x1c-\x1e, \x85, \u2028 and \u2029
+            yield from line.splitlines()
+
+
 def write_text_file(path: Path | str, content: str, encoding: str = 'utf-8') -> None:
     """Write text file with specified encoding.
     
@@ -34,3 +60,90 @@ def write_text_file(path: Path | str, content: str, encoding: str = 'utf-8') ->
     path.parent.mkdir(parents=True, exist_ok=True)
     with open(path, 'w', encoding=encoding) as f:
         f.write(content)
+
+
+def write_text_chunks(path: Path | str, chunks: Iterable[str], encoding: str = 'utf-8') -> None:
+    """Write text chunks to file as they are produced.
+    
+    If path is missing or a plain regular file, chunks are streamed to a
+    temporary file next to it, which replaces it only once every chunk was
+    written; if producing a chunk raises, the existing file is left
+    untouched. Any other target (a device or FIFO such as /dev/stdout, a
+    hard-linked file, a file whose mode, owner or extended attributes the
+    replacement could not keep) is opened and written in place, like
+    write_text_file() does.
+    
+    Args:
+        path: Path to file
+        chunks: Iterable of strings, written in order without separators
+        encoding: File encoding (e.g., 'utf-8', 'utf-8-sig')
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    replacement = _create_replacement(path)
+    if replacement is None:
+        with open(path, 'w', encoding=encoding) as f:
+            f.writelines(chunks)
+        return
+    target, tmp_path = replacement
+    try:
+        with open(tmp_path, 'w', encoding=encoding) as f:
+            f.writelines(chunks)
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _create_replacement(path: Path) -> tuple[Path, Path] | None:
+    """Create an empty temporary file to atomically replace path with.
+    
+    Returns:
+        (target, temporary path), where target is path with symlinks
+        resolved, or None if path must be written in place instead
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        st = None
+    if st is not None:
+        if not stat.S_ISREG(st.st_mode) or st.st_nlink != 1:
+            return None
+        # ACLs and other extended attributes would not carry over
+        if _has_user_xattrs(path):
+            return None
+    # Replace the file itself, so symlinks keep pointing at it
+    target = Path(os.path.realpath(path))
+    tmp_path = target.with_name(f".{target.name}.{secrets.token_hex(4)}.tmp")
+    try:
+        # Created with the usual umask-derived permissions
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    except PermissionError:
+        # The file may be writable even though its directory is not
+        return None
+    os.close(fd)
+    if st is not None:
+        try:
+            os.chmod(tmp_path, stat.S_IMODE(st.st_mode))
+            own = os.stat(tmp_path)
+            if (own.st_uid, own.st_gid) != (st.st_uid, st.st_gid):
+                os.chown(tmp_path, st.st_uid, st.st_gid)
+        except BaseException as e:
+            tmp_path.unlink()
+            if isinstance(e, PermissionError):
+                # Not allowed to keep the owner: write in place instead
+                return None
+            raise
+    return target, tmp_path
+
+
+def _has_user_xattrs(path: Path) -> bool:
+    """True if path has extended attributes other than security labels."""
+    if not hasattr(os, 'listxattr'):
+        return False
+    try:
+        names = os.listxattr(path)
+    except OSError:
+        return False
+    # security.* (e.g. SELinux) labels are assigned to new files anyway
+    return any(not name.startswith('security.') for name in names)
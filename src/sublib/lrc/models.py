@@ -1,10 +1,16 @@
 """LRC lyrics data models."""
 from __future__ import annotations
+import re
+from array import array
+from bisect import insort
 from dataclasses import dataclass, field
 from datetime import timedelta
+from functools import lru_cache
+from operator import attrgetter
+from typing import Iterator
 
 
-@dataclass(order=True, frozen=True)
+@dataclass(order=True, frozen=True, slots=True)
 class LrcTimestamp:
     """LRC timestamp [mm:ss.xx]."""
     minutes: int
@@ -13,11 +19,35 @@ class LrcTimestamp:
 
     def __str__(self) -> str:
         """Format as [mm:ss.xx]."""
-        return f"[{self.minutes:02d}:{self.seconds:02d}.{self.centiseconds:02d}]"
+        return _format_timestamp(self.minutes, self.seconds, self.centiseconds)
     
     @classmethod
     def from_string(cls, text: str) -> LrcTimestamp:
         """Parse from [mm:ss.xx] or [mm:ss.xxx]."""
+        if cls is LrcTimestamp:
+            # Timestamps repeat across lines; parse each distinct string once
+            return _cached_timestamp(text)
+        return cls._parse_string(text)
+
+    @classmethod
+    def _parse_string(cls, text: str) -> LrcTimestamp:
+        """Uncached parse behind from_string."""
+        # Fast path: fixed-width [mm:ss.xx] / [mm:ss.xxx], read by offset
+        n = len(text)
+        if (n == 10 or n == 11) and text[0] == '[' and text[-1] == ']' and text[3] == ':' and text[6] == '.':
+            try:
+                minutes = int(text[1:3])
+                seconds = int(text[4:6])
+                if n == 10:
+                    return cls(minutes, seconds, int(text[7:9]))
+                return cls(minutes, seconds, int(round(int(text[7:10]) / 10)))
+            except ValueError:
+                pass
+        return cls._from_string_slow(text)
+
+    @classmethod
+    def _from_string_slow(cls, text: str) -> LrcTimestamp:
+        """General parser for variable-width and loosely formatted timestamps."""
         # Remove brackets
         content = text.strip("[]")
         parts = content.split(":")
@@ -43,14 +73,27 @@ class LrcTimestamp:
     @classmethod
     def from_timedelta(cls, td: timedelta) -> LrcTimestamp:
         """Create from timedelta."""
-        total_seconds = td.total_seconds()
-        minutes = int(total_seconds // 60)
-        seconds = int(total_seconds % 60)
-        centiseconds = int((total_seconds * 100) % 100)
+        # Integer fields only: float total_seconds() can land just below a
+        # centisecond boundary (0.29s -> 28cs)
+        total_cs = td.days * 8_640_000 + td.seconds * 100 + td.microseconds // 10_000
+        minutes, rem = divmod(total_cs, 6000)
+        seconds, centiseconds = divmod(rem, 100)
         return cls(minutes, seconds, centiseconds)
 
 
-@dataclass
+@lru_cache(maxsize=4096)
+def _format_timestamp(minutes: int, seconds: int, centiseconds: int) -> str:
+    # Lyrics reuse a limited set of timestamps; render each one once
+    return f"[{minutes:02d}:{seconds:02d}.{centiseconds:02d}]"
+
+
+@lru_cache(maxsize=4096)
+def _cached_timestamp(text: str) -> LrcTimestamp:
+    # Frozen, so equal timestamps can safely share one instance
+    return LrcTimestamp._parse_string(text)
+
+
+@dataclass(slots=True)
 class LrcLine:
     """A single line in an LRC file."""
     timestamp: LrcTimestamp
@@ -60,55 +103,39 @@ class LrcLine:
         return f"{self.timestamp}{self.text}"
 
 
-class LrcMetadata:
-    """Intelligent container for LRC metadata."""
-    def __init__(self, data: dict[str, str] | None = None):
-        self._data = data if data is not None else {}
-
-    def __getitem__(self, key: str) -> str:
-        return self._data[key]
+# Timestamp group keeps its brackets, so matches feed from_string directly
+_LRC_TIMESTAMP_RE = re.compile(r"(\[\d{2}:\d{2}\.\d{2,3}\])")
+_LRC_TAG_RE = re.compile(r"\[([a-zA-Z]+):(.+)\]")
 
-    def __setitem__(self, key: str, value: str) -> None:
-        self._data[key] = value
+# Metadata tags written first by dumps(), in this order
+_PREFERRED_ORDER = ("ti", "ar", "al", "by", "offset")
+_PREFERRED_KEYS = frozenset(_PREFERRED_ORDER)
 
-    def __delitem__(self, key: str) -> None:
-        del self._data[key]
+# C-level sort key for LrcLine (avoids a Python lambda call per line)
+_TIMESTAMP_KEY = attrgetter('timestamp')
 
-    def __contains__(self, key: str) -> bool:
-        return key in self._data
 
-    def __iter__(self):
-        return iter(self._data)
-
-    def __len__(self) -> int:
-        return len(self._data)
+class LrcMetadata(dict[str, str]):
+    """Intelligent container for LRC metadata.
 
-    def get(self, key: str, default: str | None = None) -> str | None:
-        return self._data.get(key, default)
+    A plain dict subclass, so item access and iteration run at C speed.
+    """
+    __slots__ = ()
 
-    def keys(self):
-        return self._data.keys()
+    def __init__(self, data: dict[str, str] | None = None):
+        super().__init__(data or ())
 
-    def values(self):
-        return self._data.values()
 
-    def items(self):
-        return self._data.items()
+class LrcLines(list[LrcLine]):
+    """Intelligent container for LRC lines.
 
+    A list subclass: indexing, len and iteration are the native list
+    operations; append() additionally accepts (timestamp, text).
+    """
+    __slots__ = ()
 
-class LrcLines:
-    """Intelligent container for LRC lines."""
     def __init__(self, data: list[LrcLine] | None = None):
-        self._data = data if data is not None else []
-
-    def __getitem__(self, index: int) -> LrcLine:
-        return self._data[index]
-
-    def __len__(self) -> int:
-        return len(self._data)
-
-    def __iter__(self):
-        return iter(self._data)
+        super().__init__(data or ())
 
     def append(self, line_or_timestamp: LrcLine | str | timedelta | LrcTimestamp, text: str | None = None) -> None:
         """Append a lyrics line.
@@ -117,9 +144,32 @@ class LrcLines:
         - append(line: LrcLine)
         - append(timestamp, text)
         """
+        list.append(self, self._to_line(line_or_timestamp, text))
+
+    def add(self, line_or_timestamp: LrcLine | str | timedelta | LrcTimestamp, text: str | None = None) -> None:
+        """Insert a lyrics line at its position in timestamp order.
+        
+        Takes the same arguments as append(). Uses binary search, so lines
+        stay sorted without re-sorting the whole list on each insert; lines
+        with equal timestamps keep insertion order.
+        """
+        insort(self, self._to_line(line_or_timestamp, text), key=_TIMESTAMP_KEY)
+
+    def get_times(self) -> array:
+        """Timestamps of all lines as a centisecond array, in line order.
+        
+        The array supports the buffer protocol, so numeric consumers can
+        wrap it without copying (e.g. numpy.frombuffer).
+        """
+        return array('q', [
+            (ts.minutes * 60 + ts.seconds) * 100 + ts.centiseconds
+            for ts in map(_TIMESTAMP_KEY, self)
+        ])
+
+    @staticmethod
+    def _to_line(line_or_timestamp: LrcLine | str | timedelta | LrcTimestamp, text: str | None) -> LrcLine:
         if isinstance(line_or_timestamp, LrcLine):
-            self._data.append(line_or_timestamp)
-            return
+            return line_or_timestamp
 
         # Argument unpacking mode
         timestamp = line_or_timestamp
@@ -132,10 +182,7 @@ class LrcLines:
             ts = LrcTimestamp.from_timedelta(timestamp)
         else:
             ts = timestamp
-        self._data.append(LrcLine(ts, text))
-
-    def sort(self, **kwargs):
-        self._data.sort(**kwargs)
+        return LrcLine(ts, text)
 
 
 @dataclass
@@ -145,70 +192,91 @@ class LrcFile:
     lines: LrcLines = field(default_factory=LrcLines)
 
     def __post_init__(self):
-        if isinstance(self.metadata, dict):
+        if isinstance(self.metadata, dict) and not isinstance(self.metadata, LrcMetadata):
             self.metadata = LrcMetadata(self.metadata)
-        if isinstance(self.lines, list):
+        if isinstance(self.lines, list) and not isinstance(self.lines, LrcLines):
             self.lines = LrcLines(self.lines)
 
     @classmethod
     def loads(cls, content: str) -> LrcFile:
         """Parse LRC content from string."""
-        import re
-        TIMESTAMP_REGEX = re.compile(r"\[(\d{2}:\d{2}\.\d{2,3})\]")
-        TAG_REGEX = re.compile(r"\[([a-zA-Z]+):(.+)\]")
-
+        split_timestamps = _LRC_TIMESTAMP_RE.split
+        match_tag = _LRC_TAG_RE.match
+        # text -> shared instance; repeated lyrics (choruses) keep one string
+        text_pool: dict[str, str] = {}
         lrc_file = cls()
+        # Collect into a plain list: list.append, not the LrcLines overload
+        parsed: list[LrcLine] = []
+        append_line = parsed.append
         lines = content.splitlines()
         
         for line in lines:
             line = line.strip()
-            if not line:
+            # Timestamps and tags both need a '['
+            if '[' not in line:
                 continue
-                
-            # Find all timestamps in the line
-            timestamps = TIMESTAMP_REGEX.findall(line)
             
-            if timestamps:
-                # Remove all timestamps to get text
-                clean_text = TIMESTAMP_REGEX.sub("", line).strip()
+            if line[1:2].isalpha() and line.find('[', 1) == -1:
+                # [tag:value] with no second '[' cannot hold a timestamp
+                parts = None
+            else:
+                # One scan: split() alternates text runs and captured timestamps
+                parts = split_timestamps(line)
+            
+            if parts is not None and len(parts) > 1:
+                timestamps = parts[1::2]
+                clean_text = "".join(parts[::2]).strip()
+                clean_text = text_pool.setdefault(clean_text, clean_text)
                 
                 for ts_str in timestamps:
                     try:
-                        ts = LrcTimestamp.from_string(f"[{ts_str}]")
-                        lrc_file.lines.append(LrcLine(timestamp=ts, text=clean_text))
+                        ts = _cached_timestamp(ts_str)
+                        append_line(LrcLine(timestamp=ts, text=clean_text))
                     except ValueError:
                         continue
             else:
                 # Try parsing as metadata tag
-                tag_match = TAG_REGEX.match(line)
+                tag_match = match_tag(line)
                 if tag_match:
                     key, value = tag_match.groups()
                     lrc_file.metadata[key.strip()] = value.strip()
         
         # Sort lines by timestamp
-        lrc_file.lines._data.sort(key=lambda x: x.timestamp)
+        parsed.sort(key=_TIMESTAMP_KEY)
+        lrc_file.lines.extend(parsed)
         return lrc_file
 
     def dumps(self) -> str:
         """Render LRC file to string."""
-        buffer = []
-        preferred_order = ["ti", "ar", "al", "by", "offset"]
+        return "\n".join(self._iter_lines())
+
+    def _iter_lines(self) -> Iterator[str]:
+        """Rendered lines, without terminators; dumps() joins them with '\n'."""
+        metadata = self.metadata
+        for key in _PREFERRED_ORDER:
+            if key in metadata:
+                yield f"[{key}:{metadata[key]}]"
         
-        for key in preferred_order:
-            if key in self.metadata:
-                buffer.append(f"[{key}:{self.metadata[key]}]")
+        for key, value in metadata.items():
+            if key not in _PREFERRED_KEYS:
+                yield f"[{key}:{value}]"
         
-        for key, value in self.metadata.items():
-            if key not in preferred_order:
-                buffer.append(f"[{key}:{value}]")
-        
-        if buffer:
-            buffer.append("")
+        # Every metadata entry was written above; separate them from lyrics
+        if metadata:
+            yield ""
             
+        # Same output as str(line), skipping LrcLine.__str__; the timestamp
+        # string comes from the _format_timestamp cache
         for line in self.lines:
-            buffer.append(str(line))
-            
-        return "\n".join(buffer)
+            yield str(line.timestamp) + line.text
+
+    def _iter_chunks(self) -> Iterator[str]:
+        """Rendered text as chunks; concatenated they equal dumps()."""
+        lines = self._iter_lines()
+        # Always one chunk, so even an empty file gets its encoding's BOM
+        yield next(lines, "")
+        for line in lines:
+            yield "\n" + line
 
     @classmethod
     def load(cls, path: Path | str) -> LrcFile:
@@ -219,9 +287,9 @@ class LrcFile:
 
     def dump(self, path: Path | str) -> None:
         """Save to file."""
-        from sublib.io import write_text_file
-        content = self.dumps()
-        write_text_file(path, content, encoding='utf-8-sig')
+        from sublib.io import write_text_chunks
+        # Streamed line by line; the whole document is never one string
+        write_text_chunks(path, self._iter_chunks(), encoding='utf-8-sig')
 
 
     def __iter__(self):
@@ -0,0 +1,106 @@
+# tests/test_events.py
+"""Tests for AssEvents bulk operations."""
+import pytest
+
+from sublib.ass import AssFile
+from sublib.ass.models.event import AssEvent, AssEvents
+from sublib.ass.types import AssTimestamp
+
+
+def _events(*times: tuple[int, int]) -> AssEvents:
+    """Events with the given (start, end) times in centiseconds."""
+    return AssEvents([
+        AssEvent.create(f"line {i}", AssTimestamp(start), AssTimestamp(end))
+        for i, (start, end) in enumerate(times)
+    ])
+
+
+def _times(events: AssEvents) -> list[tuple[int, int]]:
+    return [(e.start.cs, e.end.cs) for e in events]
+
+
+class TestShift:
+    def test_shift_forward(self):
+        events = _events((100, 200), (300, 450))
+        events.shift(1500)
+        assert _times(events) == [(250, 350), (450, 600)]
+
+    def test_shift_rounds_symmetrically(self):
+        events = _events((100, 200))
+        events.shift(15)
+        assert _times(events) == [(102, 202)]
+        events.shift(-15)
+        assert _times(events) == [(100, 200)]
+
+    def test_shift_clamps_at_zero(self):
+        events = _events((50, 300))
+        events.shift(-1000)
+        assert _times(events) == [(0, 200)]
+        assert events[0].start.to_ass_str() == "0:00:00.00"
+
+    def test_shift_does_not_touch_schema_default(self):
+        events = AssEvents([AssEvent(), AssEvent()])
+        events.shift(1000)
+        assert _times(events) == [(100, 100), (100, 100)]
+        assert AssEvent().start.cs == 0
+
+
+class TestSortByTime:
+    def test_sort_by_start_is_stable(self):
+        events = _events((300, 400), (100, 200), (300, 350), (0, 50))
+        texts = [e.text for e in events]
+        events.sort_by_time()
+        assert _times(events) == [(0, 50), (100, 200), (300, 400), (300, 350)]
+        assert [e.text for e in events] == [texts[3], texts[1], texts[0], texts[2]]
+
+
+class TestTimeColumns:
+    def test_get_times(self):
+        events = _events((100, 200), (300, 450))
+        starts, ends = events.get_times()
+        assert list(starts) == [100, 300]
+        assert list(ends) == [200, 450]
+
+    def test_set_times_roundtrip(self):
+        events = _events((100, 200), (300, 450))
+        starts, ends = events.get_times()
+        events.set_times([s * 2 for s in starts], [e * 2 for e in ends])
+        assert _times(events) == [(200, 400), (600, 900)]
+
+    def test_set_times_length_mismatch(self):
+        events = _events((100, 200), (300, 450))
+        with pytest.raises(ValueError):
+            events.set_times([0], [1, 2])
+        assert _times(events) == [(100, 200), (300, 450)]
+
+
+class TestIntColumn:
+    def test_get_int_column(self):
+        events = _events((0, 100), (0, 100), (0, 100))
+        for event, layer in zip(events, (0, 3, 1)):
+            event.layer = layer
+        events[1].margin_v = 20
+        assert list(events.get_int_column('layer')) == [0, 3, 1]
+        assert list(events.get_int_column('margin_v')) == [0, 20, 0]
+
+    def test_margins_of_loaded_file(self):
+        content = (
+            "[Script Info]\nScriptType: v4.00+\n\n[Events]\n"
+            "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n"
+            "Dialogue: 0,0:00:01.00,0:00:02.00,Default,,5,6,7,,a"
+        )
+        ass_file = AssFile.loads(content)
+        events = ass_file.events
+        assert list(events.get_int_column('margin_l')) == [5]
+        assert list(events.get_int_column('margin_r')) == [6]
+        assert list(events.get_int_column('margin_v')) == [7]
+        assert (events[0].margin_l, events[0].margin_r, events[0].margin_v) == (5, 6, 7)
+
+        events[0].margin_v = 8
+        assert list(events.get_int_column('margin_v')) == [8]
+        assert ass_file.dumps().endswith("Dialogue: 0,0:00:01.00,0:00:02.00,Default,,5,6,8,,a")
+
+    @pytest.mark.parametrize("name", ["text", "start", "nope"])
+    def test_get_int_column_rejects_non_int_fields(self, name):
+        with pytest.raises(ValueError):
+            _events((0, 100)).get_int_column(name)
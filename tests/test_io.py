@@ -0,0 +1,149 @@
+# tests/test_io.py
+"""Tests for loading and saving files."""
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from sublib.ass import AssFile
+from sublib.ass.engines.doc_renderer import AssRenderer
+from sublib.ass.engines.structural_parser import StructuralParser
+from sublib.exceptions import SubtitleParseError
+
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+ASS_CONTENT = """[Script Info]
+ScriptType: v4.00+
+
+[V4+ Styles]
+Format: Name, Fontname, Fontsize
+Style: Default,Arial,20
+
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+Dialogue: 0,0:00:01.00,0:00:02.00,Default,,0,0,0,,ok
+Dialogue: 0,0:00:02.00,0:00:03.00,Default,,0,0,0,,{BAD_TEXT}
+"""
+
+
+class TestDump:
+    def test_dump_writes_rendered_content(self, tmp_path):
+        path = tmp_path / "out.ass"
+        ass_file = AssFile.loads(ASS_CONTENT.replace("{BAD_TEXT}", "fine"))
+        ass_file.dump(path)
+
+        assert path.read_text(encoding="utf-8-sig") == ass_file.dumps()
+        assert [p.name for p in tmp_path.iterdir()] == ["out.ass"]
+
+    def test_failed_dump_in_place_keeps_original(self, tmp_path):
+        path = tmp_path / "in.ass"
+        content = ASS_CONTENT.replace("{BAD_TEXT}", "{\\fsp1.50}bad")
+        path.write_text(content, encoding="utf-8-sig")
+        ass_file = AssFile.load(path)
+
+        with pytest.raises(SubtitleParseError):
+            ass_file.dump(path)
+
+        assert path.read_text(encoding="utf-8-sig") == content
+        assert [p.name for p in tmp_path.iterdir()] == ["in.ass"]
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs mkfifo")
+    def test_dump_to_fifo(self, tmp_path):
+        path = tmp_path / "pipe"
+        os.mkfifo(path)
+        ass_file = AssFile.loads(ASS_CONTENT.replace("{BAD_TEXT}", "fine"))
+        received = []
+        reader = threading.Thread(
+            target=lambda: received.append(path.read_text(encoding="utf-8-sig")))
+        reader.start()
+        ass_file.dump(path)
+        reader.join(timeout=5)
+
+        assert received == [ass_file.dumps()]
+        assert path.is_fifo()
+        assert [p.name for p in tmp_path.iterdir()] == ["pipe"]
+
+    @pytest.mark.skipif(not os.path.exists("/dev/stdout"), reason="needs /dev/stdout")
+    def test_dump_to_stdout(self):
+        content = ASS_CONTENT.replace("{BAD_TEXT}", "fine")
+        code = (
+            "import sys\n"
+            "from sublib.ass import AssFile\n"
+            "AssFile.loads(sys.stdin.read()).dump('/dev/stdout')"
+        )
+        # A pipe, not a regular file, is the child's standard output
+        result = subprocess.run(
+            [sys.executable, "-c", code], input=content.encode(), capture_output=True,
+            env={**os.environ, "PYTHONPATH": SRC_DIR}, check=True)
+
+        assert result.stdout.decode("utf-8-sig") == AssFile.loads(content).dumps()
+
+    def test_dump_keeps_hard_links(self, tmp_path):
+        path = tmp_path / "a.ass"
+        path.write_text("old", encoding="utf-8")
+        os.link(path, tmp_path / "b.ass")
+        ass_file = AssFile.loads(ASS_CONTENT.replace("{BAD_TEXT}", "fine"))
+        ass_file.dump(path)
+
+        assert (tmp_path / "b.ass").read_text(encoding="utf-8-sig") == ass_file.dumps()
+        assert path.stat().st_nlink == 2
+
+    @pytest.mark.skipif(not hasattr(os, "geteuid") or os.geteuid() == 0,
+                        reason="needs POSIX permissions that apply to the user")
+    def test_dump_into_read_only_directory(self, tmp_path):
+        path = tmp_path / "a.ass"
+        path.write_text("old", encoding="utf-8")
+        ass_file = AssFile.loads(ASS_CONTENT.replace("{BAD_TEXT}", "fine"))
+        tmp_path.chmod(0o555)
+        try:
+            ass_file.dump(path)
+        finally:
+            tmp_path.chmod(0o755)
+
+        assert path.read_text(encoding="utf-8-sig") == ass_file.dumps()
+
+
+class TestLoad:
+    @pytest.mark.parametrize("separator", ["\u2028", "\x85", "\x0c", "\x1e"])
+    def test_load_and_loads_split_lines_alike(self, tmp_path, separator):
+        content = ASS_CONTENT.replace("{BAD_TEXT}", f"one{separator}two")
+        path = tmp_path / "in.ass"
+        path.write_text(content, encoding="utf-8-sig", newline="")
+
+        from_file = AssFile.load(path)
+        from_string = AssFile.loads(content)
+
+        assert [e.text for e in from_file.events] == [e.text for e in from_string.events]
+        assert [(d.message, d.line_number) for d in from_file.diagnostics] == \
+            [(d.message, d.line_number) for d in from_string.diagnostics]
+
+    def test_parse_lines_matches_parse(self):
+        content = ASS_CONTENT.replace("{BAD_TEXT}", "fine")
+        from_lines = StructuralParser().parse_lines(iter(content.splitlines()))
+        from_string = StructuralParser().parse(content)
+
+        assert from_lines == from_string
+        assert [s.name for s in from_lines.sections] == ["script info", "v4+ styles", "events"]
+        assert len(from_lines.sections[2].records) == 2
+
+
+class TestIterFile:
+    @pytest.mark.parametrize("extra", ["", "\n[Aegisub Project Garbage]\nVideo File: a.mkv\n"])
+    def test_chunks_join_to_render_file(self, extra):
+        ass_file = AssFile.loads(ASS_CONTENT.replace("{BAD_TEXT}", "fine") + extra)
+        renderer = AssRenderer()
+
+        chunks = list(renderer.iter_file(ass_file))
+
+        assert len(chunks) > 1
+        assert "".join(chunks) == renderer.render_file(ass_file)
+
+    def test_empty_events_section_is_skipped(self):
+        content = ASS_CONTENT.split("Dialogue:")[0]
+        ass_file = AssFile.loads(content)
+        renderer = AssRenderer()
+
+        assert "".join(renderer.iter_file(ass_file)) == renderer.render_file(ass_file)
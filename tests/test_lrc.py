@@ -0,0 +1,96 @@
+# tests/test_lrc.py
+"""Tests for LRC models."""
+import os
+import threading
+from dataclasses import asdict, astuple, fields
+from datetime import timedelta
+
+import pytest
+
+from sublib.lrc import loads
+from sublib.lrc.models import LrcFile, LrcLine, LrcLines, LrcMetadata, LrcTimestamp
+
+
+class TestLrcLines:
+    def test_add_keeps_timestamp_order(self):
+        lines = LrcLines()
+        lines.add("[00:03.00]", "c")
+        lines.add(LrcLine(LrcTimestamp(0, 1, 0), "a"))
+        lines.add(timedelta(seconds=2), "b")
+        assert [line.text for line in lines] == ["a", "b", "c"]
+
+    def test_add_after_equal_timestamps(self):
+        lines = LrcLines()
+        lines.add("[00:01.00]", "first")
+        lines.add("[00:01.00]", "second")
+        lines.add("[00:00.50]", "zero")
+        assert [line.text for line in lines] == ["zero", "first", "second"]
+
+    def test_add_into_loaded_lines(self):
+        lrc_file = loads("[00:01.00]a\n[00:03.00]c")
+        lrc_file.lines.add("[00:02.00]", "b")
+        assert lrc_file.dumps() == "[00:01.00]a\n[00:02.00]b\n[00:03.00]c"
+
+    def test_get_times(self):
+        lrc_file = loads("[ti:x]\n[01:02.34]a\n[00:00.50][00:01.00]b")
+        assert list(lrc_file.lines.get_times()) == [50, 100, 6234]
+        assert list(LrcLines().get_times()) == []
+
+    def test_construct_from_none(self):
+        assert list(LrcLines(None)) == []
+        assert list(LrcLines([LrcLine(LrcTimestamp(0, 1, 0), "a")]))[0].text == "a"
+
+
+class TestLrcMetadata:
+    def test_construct_from_none(self):
+        assert dict(LrcMetadata(None)) == {}
+        assert LrcMetadata({"ti": "x"})["ti"] == "x"
+
+
+class TestLrcTimestamp:
+    def test_str(self):
+        assert str(LrcTimestamp(1, 2, 3)) == "[01:02.03]"
+        assert str(LrcLine(LrcTimestamp(0, 0, 50), "x")) == "[00:00.50]x"
+
+    def test_from_timedelta_exact_centiseconds(self):
+        # Float total_seconds() would give 0.28999... and floor to 28cs
+        assert LrcTimestamp.from_timedelta(timedelta(seconds=0.29)) == LrcTimestamp(0, 0, 29)
+
+    def test_from_timedelta_over_a_day(self):
+        ts = LrcTimestamp.from_timedelta(timedelta(days=1, seconds=61, microseconds=500_000))
+        assert ts == LrcTimestamp(1441, 1, 50)
+        assert str(ts) == "[1441:01.50]"
+
+    def test_from_timedelta_truncates_sub_centiseconds(self):
+        assert LrcTimestamp.from_timedelta(timedelta(seconds=1, microseconds=19_999)) == LrcTimestamp(0, 1, 1)
+        assert LrcTimestamp.from_timedelta(timedelta(microseconds=9_999)) == LrcTimestamp(0, 0, 0)
+
+    def test_dataclass_fields_unaffected_by_rendering(self):
+        ts = LrcTimestamp(1, 2, 3)
+        line = LrcLine(ts, "x")
+        before = asdict(line)
+        str(line)
+        assert asdict(line) == before
+        assert astuple(ts) == (1, 2, 3)
+        assert [f.name for f in fields(LrcTimestamp)] == ["minutes", "seconds", "centiseconds"]
+
+
+class TestLrcFileDump:
+    def test_empty_file_gets_bom(self, tmp_path):
+        path = tmp_path / "empty.lrc"
+        LrcFile().dump(path)
+        assert path.read_bytes() == b"\xef\xbb\xbf"
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs mkfifo")
+    def test_dump_to_fifo(self, tmp_path):
+        path = tmp_path / "pipe"
+        os.mkfifo(path)
+        lrc_file = loads("[ti:x]\n[00:01.00]a\n[00:02.00]b")
+        received = []
+        reader = threading.Thread(target=lambda: received.append(path.read_bytes()))
+        reader.start()
+        lrc_file.dump(path)
+        reader.join(timeout=5)
+
+        assert received == [lrc_file.dumps().encode("utf-8-sig")]
+        assert path.is_fifo()
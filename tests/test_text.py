@@ -0,0 +1,51 @@
+# tests/test_text.py
+"""Tests for text parsing options and tag extraction."""
+from sublib.ass.engines.text import AssTextParser, AssTextRenderer
+from sublib.ass.engines.text.text_transform import (
+    extract_event_tags_and_segments,
+    extract_event_tags_and_segment_tuples,
+)
+from sublib.ass.types import AssAlpha, AssPosition
+
+
+TEXT = "{\\b1\\pos(10,20)\\fs020\\c&Hff&}Hi\\N{\\i1}there"
+
+
+class TestKeepRaw:
+    def test_keep_raw_roundtrips_exactly(self):
+        elements = AssTextParser().parse(TEXT)
+        assert [tag.raw for tag in elements[0].elements] == ["\\b1", "\\pos(10,20)", "\\fs020", "\\c&Hff&"]
+        assert AssTextRenderer().render(elements) == TEXT
+
+    def test_without_raw_tags_are_formatted_from_values(self):
+        elements = AssTextParser(keep_raw=False).parse(TEXT)
+        assert all(tag.raw is None for tag in elements[0].elements)
+        assert AssTextRenderer().render(elements) == "{\\b1\\pos(10,20)\\fs20\\c&H0000FF&}Hi\\N{\\i1}there"
+
+    def test_values_match_either_way(self):
+        with_raw = AssTextParser().parse(TEXT)
+        without_raw = AssTextParser(keep_raw=False).parse(TEXT)
+        assert [(t.name, t.value) for t in with_raw[0].elements] == \
+            [(t.name, t.value) for t in without_raw[0].elements]
+
+
+class TestAlphaTags:
+    def test_trailing_h_alpha_is_parsed(self):
+        elements = AssTextParser().parse("{\\alpha&H80H\\1a&HC8H&}a")
+        assert [(t.name, t.value) for t in elements[0].elements] == \
+            [("alpha", AssAlpha(0x80)), ("1a", AssAlpha(0xC8))]
+
+
+class TestSegmentTuples:
+    def test_tuples_match_segments(self):
+        elements = AssTextParser().parse("{\\pos(10,20)\\b1}Hi\\N{\\i1}there")
+        event_tags, segments = extract_event_tags_and_segments(elements)
+        tuple_event_tags, tuples = extract_event_tags_and_segment_tuples(elements)
+
+        assert tuple_event_tags == event_tags == {"pos": AssPosition(10, 20)}
+        assert tuples == [(s.block_tags, s.content) for s in segments]
+        assert [tags for tags, _ in tuples] == [{"b": True}, {"i": True}]
+
+    def test_no_content_gives_no_segments(self):
+        elements = AssTextParser().parse("{\\b1}")
+        assert extract_event_tags_and_segment_tuples(elements) == ({}, [])
@@ -0,0 +1,61 @@
+# tests/test_types.py
+"""Tests for ASS value types."""
+from dataclasses import asdict, astuple, fields
+
+import pytest
+
+from sublib.ass.types import AssAlpha, AssColor
+
+
+class TestAssColor:
+    def test_equality_and_hash(self):
+        assert AssColor(1, 2, 3, 4) == AssColor(1, 2, 3, 4)
+        assert hash(AssColor(1, 2, 3, 4)) == hash(AssColor(1, 2, 3, 4))
+        assert AssColor(1, 2, 3, 4) != AssColor(1, 2, 3, 5)
+
+    def test_out_of_range_channels_do_not_collide(self):
+        assert AssColor(256, 0, 0) != AssColor(0, 1, 0)
+        assert AssColor(-1, 0, 0) != AssColor(255, 255, 255, 255)
+        assert AssColor(300, 0, 0) == AssColor(300, 0, 0)
+        assert len({AssColor(256, 0, 0), AssColor(0, 1, 0)}) == 2
+
+    def test_format(self):
+        color = AssColor(0x12, 0x34, 0x56, 0x78)
+        assert color.to_style_str() == "&H78563412"
+        assert color.to_tag_str() == "&H563412&"
+
+    def test_format_out_of_range_channels(self):
+        assert AssColor(-1, 0, 0).to_style_str() == "&H000000-1"
+        assert AssColor(-1, 0, 0).to_tag_str() == "&H0000-1&"
+        assert AssColor(256, 0, 0).to_style_str() == "&H000000100"
+
+    def test_dataclass_fields_unaffected_by_packing(self):
+        color = AssColor(255, 255, 255)
+        hash(color)
+        assert color == AssColor(255, 255, 255)
+        assert astuple(color) == (255, 255, 255, 0)
+        assert asdict(color) == {"r": 255, "g": 255, "b": 255, "a": 0}
+        assert [f.name for f in fields(AssColor)] == ["r", "g", "b", "a"]
+
+
+class TestAssAlpha:
+    def test_from_tag_str(self):
+        assert AssAlpha.from_tag_str("&H80&") == AssAlpha(0x80)
+        assert AssAlpha.from_tag_str("&Hff&") == AssAlpha(255)
+        assert AssAlpha.from_tag_str("&H7&") == AssAlpha(7)
+
+    def test_from_tag_str_trailing_h(self):
+        assert AssAlpha.from_tag_str("&H80H") == AssAlpha(0x80)
+        assert AssAlpha.from_tag_str("&HC8H&") == AssAlpha(0xC8)
+
+    def test_from_tag_str_invalid(self):
+        with pytest.raises(ValueError):
+            AssAlpha.from_tag_str("&H&")
+
+    def test_format(self):
+        assert AssAlpha(0).to_tag_str() == "&H00&"
+        assert AssAlpha(255).to_tag_str() == "&HFF&"
+
+    def test_format_out_of_range(self):
+        assert AssAlpha(-1).to_tag_str() == "&H-1&"
+        assert AssAlpha(256).to_tag_str() == "&H100&"